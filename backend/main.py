@@ -1,12 +1,27 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Annotated, List, Optional
 import mysql.connector
+import mysql.connector.pooling
 from datetime import datetime
 import re
+import threading
+import hashlib
+import orjson
+import anyio.to_thread
+from cachetools import LRUCache, TTLCache
+from contextlib import asynccontextmanager
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup work, in order; the helpers are defined further down
+    limit_worker_threads()
+    warm_db_pool()
+    warm_orchestrator()
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS logic
 app.add_middleware(
@@ -26,8 +41,62 @@ DB_CONFIG = {
     'database': 'db'
 }
 
+POOL_SIZE = 10
+
+# Created lazily so importing this module (e.g. from verify_logic.py) does not
+# require a reachable database.
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_db_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name="t180",
+                pool_size=POOL_SIZE,
+                pool_reset_session=True,
+                **DB_CONFIG
+            )
+    return _pool
+
 def get_db_connection():
-    return mysql.connector.connect(**DB_CONFIG)
+    # close() on a pooled connection hands it back to the pool
+    return get_db_pool().get_connection()
+
+def limit_worker_threads():
+    # The sync endpoints run in Starlette's threadpool (40 threads by default).
+    # The connection pool raises instead of waiting when it is exhausted, so cap
+    # the threadpool at the pool size and let extra requests queue for a thread.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE
+
+def warm_db_pool():
+    # Creating the pool opens all POOL_SIZE connections up front
+    try:
+        get_db_pool()
+    except mysql.connector.Error as e:
+        print(f"Error: could not warm connection pool: {e}")
+
+# Response caches, keyed by the (MAX(added_time), COUNT(*)) version of 'main'.
+# The last computed values are kept separately and served if the DB is down.
+_cache_lock = threading.Lock()
+_entries_cache = TTLCache(maxsize=4, ttl=5)
+_pred_cache = TTLCache(maxsize=16, ttl=15)
+# Orchestrator results keyed by the identity of the recent entries themselves;
+# unlike the caches above this survives star toggles and TTL expiry
+_workflow_cache = LRUCache(maxsize=64)
+_stale_entries = LRUCache(maxsize=16)
+_stale_prediction = None
+
+def _fetch_entries_version(cursor):
+    # Cheap aggregate, lets us skip the full scan when nothing changed
+    cursor.execute("SELECT MAX(added_time), COUNT(*) FROM main")
+    return tuple(cursor.fetchone())
+
+def invalidate_caches():
+    with _cache_lock:
+        _entries_cache.clear()
+        _pred_cache.clear()
 
 # Models
 class ClipboardEntry(BaseModel):
@@ -54,6 +123,20 @@ from klipper_sdk.orchestrator import Orchestrator
 orchestrator = Orchestrator()
 blueprint_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "workflow_prediction.kl")
 orchestrator.load_blueprint(blueprint_path)
+# execute() keeps its working state on the instance, so runs from
+# concurrent request threads must not interleave
+_orchestrator_lock = threading.Lock()
+
+def warm_orchestrator():
+    # First run pays one-time costs (lazy imports, tool dispatch); do it before serving
+    try:
+        with _orchestrator_lock:
+            orchestrator.execute(dynamic_context={"entries": []})
+    except Exception as e:
+        print(f"Error: orchestrator warm-up failed: {e}")
+
+# Number of most recent entries the prediction looks at
+PREDICTION_WINDOW = 10
 
 def predict_workflow(entries: List[ClipboardEntry]) -> WorkflowPrediction:
     if not entries:
@@ -64,9 +147,22 @@ def predict_workflow(entries: List[ClipboardEntry]) -> WorkflowPrediction:
     # The blueprint 'workflow_prediction.kl' defines the steps 'analyze_entries' and 'predict_workflow'.
     
     # We use a recent subset to mimic the previous logic's optimization
-    recent_entries = entries[:10]
+    recent_entries = entries[:PREDICTION_WINDOW]
+    
+    # Nothing to classify (e.g. image-only clipboards); skip the orchestrator
+    if not any((e.text or "").strip() for e in recent_entries):
+        return WorkflowPrediction(name="Unknown", confidence=0.0, reasoning="No textual content.")
     
-    result_state = orchestrator.execute(dynamic_context={"entries": recent_entries})
+    # Entry content never changes for a given uuid, so the same recent set
+    # always yields the same prediction
+    key = frozenset((e.uuid, e.added_time, e.last_used_time) for e in recent_entries)
+    with _cache_lock:
+        cached = _workflow_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    with _orchestrator_lock:
+        result_state = orchestrator.execute(dynamic_context={"entries": recent_entries})
     
     # Extract prediction from the result state
     pred_data = result_state.get('prediction')
@@ -74,36 +170,107 @@ def predict_workflow(entries: List[ClipboardEntry]) -> WorkflowPrediction:
     if not pred_data:
         return WorkflowPrediction(name="Error", confidence=0.0, reasoning="Orchestration failed to produce prediction.")
         
-    return WorkflowPrediction(
+    prediction = WorkflowPrediction(
         name=pred_data.get('name', 'Unknown'),
         confidence=pred_data.get('confidence', 0.0),
         reasoning=pred_data.get('reasoning', '')
     )
+    with _cache_lock:
+        _workflow_cache[key] = prediction
+    return prediction
+
+# Join main and aux to get mimetype if needed, but main has 'mimetypes' text col
+# The schema shows 'main' has all we need
+_ENTRIES_SQL = (
+    "SELECT uuid, added_time, last_used_time, mimetypes, text, starred FROM main "
+    "ORDER BY added_time DESC LIMIT %s OFFSET %s"
+)
+# MySQL has no 'LIMIT ALL'; a row count no table reaches stands in for it
+_NO_LIMIT = 2 ** 63 - 1
 
-@app.get("/api/entries", response_model=List[ClipboardEntry])
-def get_entries():
+# The classifiers only need a prefix of each entry; cap it in the DB so large
+# clipboard payloads never cross the wire for a prediction
+PREDICTION_TEXT_LIMIT = 2048
+_PREDICT_SQL = (
+    "SELECT uuid, added_time, last_used_time, mimetypes, "
+    f"SUBSTRING(text, 1, {PREDICTION_TEXT_LIMIT}) AS text, starred FROM main "
+    "ORDER BY added_time DESC LIMIT %s OFFSET %s"
+)
+
+def _fetch_rows(conn, limit: int, offset: int = 0, query: str = _ENTRIES_SQL) -> List[dict]:
+    # Unbuffered cursor: rows are converted as they arrive instead of
+    # materializing the whole result set first
+    cursor = conn.cursor(dictionary=True, buffered=False)
+    cursor.execute(query, (limit, offset))
+    rows = [
+        {
+            "uuid": row['uuid'],
+            "added_time": row['added_time'],
+            "last_used_time": row['last_used_time'],
+            "mimetypes": row['mimetypes'],
+            "text": row['text'],
+            "starred": bool(row['starred']),
+        }
+        for row in cursor
+    ]
+    cursor.close()
+    return rows
+
+def _fetch_recent(conn, limit: int, offset: int = 0, query: str = _ENTRIES_SQL) -> List[ClipboardEntry]:
+    # Column types are fixed by the schema, so skip per-row validation
+    return [ClipboardEntry.model_construct(**row) for row in _fetch_rows(conn, limit, offset, query)]
+
+def _serialize_page(rows: List[dict]):
+    # ETag hashes the body rather than the table version, so star toggles
+    # (which keep MAX(added_time)/COUNT(*) unchanged) still produce a new tag
+    body = orjson.dumps(rows)
+    return f'W/"{hashlib.md5(body).hexdigest()}"', body
+
+def _page_response(page, if_none_match: Optional[str]) -> Response:
+    etag, body = page
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# No response_model: rows go straight to orjson instead of being re-validated
+# per item. 'responses' keeps the schema in the OpenAPI docs.
+# Paging is opt-in: without 'limit' the whole history is returned, since the
+# frontend filters (starred, time range, mimetype) client-side.
+@app.get("/api/entries", responses={200: {"model": List[ClipboardEntry]}})
+def get_entries(
+    limit: Annotated[Optional[int], Query(ge=1, le=1000)] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    page = (limit, offset)
     try:
         conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        # Join main and aux to get mimetype if needed, but main has 'mimetypes' text col
-        # The schema shows 'main' has all we need
-        cursor.execute("SELECT uuid, added_time, last_used_time, mimetypes, text, starred FROM main ORDER BY added_time DESC")
-        rows = cursor.fetchall()
-        
-        entries = []
-        for row in rows:
-            entries.append(ClipboardEntry(
-                uuid=row['uuid'],
-                added_time=row['added_time'],
-                last_used_time=row['last_used_time'],
-                mimetypes=row['mimetypes'],
-                text=row['text'],
-                starred=bool(row['starred'])
-            ))
+        try:
+            cursor = conn.cursor()
+            version = _fetch_entries_version(cursor)
+            cursor.close()
+            with _cache_lock:
+                cached = _entries_cache.get((version, page))
+            if cached is not None:
+                return _page_response(cached, if_none_match)
+
+            rows = _fetch_rows(conn, _NO_LIMIT if limit is None else limit, offset)
+        finally:
+            conn.close()
         
-        cursor.close()
-        conn.close()
-        return entries
+        serialized = _serialize_page(rows)
+        with _cache_lock:
+            _entries_cache[(version, page)] = serialized
+            _stale_entries[page] = serialized
+        return _page_response(serialized, if_none_match)
+    except mysql.connector.Error as e:
+        print(f"Error: {e}")
+        with _cache_lock:
+            stale = _stale_entries.get(page)
+        if stale is not None:
+            return _page_response(stale, if_none_match)
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         print(f"Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -112,30 +279,58 @@ def get_entries():
 def toggle_star(uuid: str):
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Check current state
-        cursor.execute("SELECT starred FROM main WHERE uuid = %s", (uuid,))
-        result = cursor.fetchone()
-        if not result:
-            raise HTTPException(status_code=404, detail="Entry not found")
-        
-        new_state = not result[0]
-        cursor.execute("UPDATE main SET starred = %s WHERE uuid = %s", (new_state, uuid))
-        conn.commit()
-        
-        cursor.close()
-        conn.close()
+        try:
+            cursor = conn.cursor()
+            
+            # Flip in place; NULL counts as unstarred
+            cursor.execute("UPDATE main SET starred = NOT COALESCE(starred, 0) WHERE uuid = %s", (uuid,))
+            if cursor.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Entry not found")
+            
+            cursor.execute("SELECT starred FROM main WHERE uuid = %s", (uuid,))
+            new_state = bool(cursor.fetchone()[0])
+            conn.commit()
+            
+            cursor.close()
+        finally:
+            conn.close()
+        invalidate_caches()
         return {"starred": new_state}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/prediction", response_model=WorkflowPrediction)
 def get_prediction():
-    # Helper to fetch entries first
-    entries = get_entries()
-    return predict_workflow(entries)
+    global _stale_prediction
+    try:
+        # Version check and the recent-rows read share one pooled connection
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            version = _fetch_entries_version(cursor)
+            cursor.close()
+            with _cache_lock:
+                cached = _pred_cache.get(version)
+            if cached is not None:
+                return cached
+
+            entries = _fetch_recent(conn, PREDICTION_WINDOW, query=_PREDICT_SQL)
+        finally:
+            conn.close()
+    except mysql.connector.Error as e:
+        print(f"Error: {e}")
+        if _stale_prediction is not None:
+            return _stale_prediction
+        raise HTTPException(status_code=500, detail=str(e))
+
+    prediction = predict_workflow(entries)
+    with _cache_lock:
+        _pred_cache[version] = prediction
+        _stale_prediction = prediction
+    return prediction
 
 if __name__ == "__main__":
     import uvicorn
@@ -5,29 +5,34 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from main import predict_workflow, ClipboardEntry
 import time
 
+# Built once with model_construct (trusted literals) and a single timestamp
+NOW = time.time()
+
+# Scene 1: Frontend Dev
+FRONTEND_ENTRIES = [
+    ClipboardEntry.model_construct(uuid="1", added_time=NOW, mimetypes="text/plain", text="import React from 'react';", starred=False),
+    ClipboardEntry.model_construct(uuid="2", added_time=NOW, mimetypes="text/plain", text="<div className='App'>", starred=False),
+    ClipboardEntry.model_construct(uuid="3", added_time=NOW, mimetypes="text/plain", text="const [state, setState] = useState(0);", starred=False),
+    ClipboardEntry.model_construct(uuid="4", added_time=NOW, mimetypes="text/plain", text="npm start", starred=False),
+    ClipboardEntry.model_construct(uuid="5", added_time=NOW, mimetypes="text/plain", text="background-color: #fff;", starred=False),
+]
+
+# Scene 2: Backend/Data
+BACKEND_ENTRIES = [
+    ClipboardEntry.model_construct(uuid="1", added_time=NOW, mimetypes="text/plain", text="SELECT * FROM users WHERE id = 1", starred=False),
+    ClipboardEntry.model_construct(uuid="2", added_time=NOW, mimetypes="text/plain", text="import pandas as pd", starred=False),
+    ClipboardEntry.model_construct(uuid="3", added_time=NOW, mimetypes="text/plain", text="df = pd.read_csv('data.csv')", starred=False),
+    ClipboardEntry.model_construct(uuid="4", added_time=NOW, mimetypes="text/plain", text="def process_data(data):\n return data", starred=False),
+]
+
 def test_prediction():
     print("\nTesting predict_workflow (via Gen 5 Orchestrator)...")
     
-    # Scene 1: Frontend Dev
-    entries_frontend = [
-        ClipboardEntry(uuid="1", added_time=time.time(), mimetypes="text/plain", text="import React from 'react';", starred=False),
-        ClipboardEntry(uuid="2", added_time=time.time(), mimetypes="text/plain", text="<div className='App'>", starred=False),
-        ClipboardEntry(uuid="3", added_time=time.time(), mimetypes="text/plain", text="const [state, setState] = useState(0);", starred=False),
-        ClipboardEntry(uuid="4", added_time=time.time(), mimetypes="text/plain", text="npm start", starred=False),
-        ClipboardEntry(uuid="5", added_time=time.time(), mimetypes="text/plain", text="background-color: #fff;", starred=False),
-    ]
-    pred = predict_workflow(entries_frontend)
+    pred = predict_workflow(FRONTEND_ENTRIES)
     print(f"Scenario: Frontend Dev -> Predicted: {pred.name} ({pred.confidence})")
     assert pred.name == "Frontend Development"
 
-    # Scene 2: Backend/Data
-    entries_backend = [
-        ClipboardEntry(uuid="1", added_time=time.time(), mimetypes="text/plain", text="SELECT * FROM users WHERE id = 1", starred=False),
-        ClipboardEntry(uuid="2", added_time=time.time(), mimetypes="text/plain", text="import pandas as pd", starred=False),
-        ClipboardEntry(uuid="3", added_time=time.time(), mimetypes="text/plain", text="df = pd.read_csv('data.csv')", starred=False),
-        ClipboardEntry(uuid="4", added_time=time.time(), mimetypes="text/plain", text="def process_data(data):\n return data", starred=False),
-    ]
-    pred = predict_workflow(entries_backend)
+    pred = predict_workflow(BACKEND_ENTRIES)
     print(f"Scenario: Backend/Data -> Predicted: {pred.name} ({pred.confidence})")
     assert pred.name in ["Backend Development", "Data Science"]
 
@@ -17,6 +17,7 @@ CREATE TABLE `main` (
   `text` text,
   `starred` tinyint(1),
   PRIMARY KEY (`uuid`),
+  KEY `idx_main_added_time` (`added_time` DESC),
   CONSTRAINT `main_chk_bpmd53ir` CHECK ((`added_time` > 0)),
   CONSTRAINT `main_chk_01k9530r` CHECK ((`last_used_time` > 0))
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_bin;
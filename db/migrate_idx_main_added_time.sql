@@ -0,0 +1,3 @@
+-- Adds the index backing 'ORDER BY added_time DESC' to databases created
+-- before it was part of doltdump.sql. Run once: dolt sql < migrate_idx_main_added_time.sql
+CREATE INDEX idx_main_added_time ON main (added_time DESC);
@@ -1,4 +1,8 @@
-import time
+import asyncio
+import hashlib
+import logging
+import logging.handlers
+import queue
 import uuid
 from datetime import datetime
 from klipper_sdk.orchestrator import Orchestrator
@@ -7,6 +11,23 @@ from klipper_sdk.memory import SpatialMemory
 from klipper_sdk.meta_critic import MetaCritic
 from klipper_sdk.interface import SpaceInterface
 
+logger = logging.getLogger(__name__)
+
+# Mock processing blueprint; the step reads the current event from workflow state
+CYCLE_BLUEPRINT = """
+planes:
+  agentic:
+    - name: "Worker"
+      role: "Processor"
+  structural:
+    - name: "ProcessPhase"
+      steps:
+        - name: "ProcessStep"
+          agent: "Worker"
+          inputs: { "data": "input_event" }
+          outputs: "result"
+"""
+
 class LifeCycle:
     """
     Integrates all 10 Generations into a single loop.
@@ -14,6 +35,7 @@ class LifeCycle:
     def __init__(self):
         # Gen 5: The Conductor
         self.orchestrator = Orchestrator()
+        self.orchestrator.parse_blueprint(CYCLE_BLUEPRINT)
         
         # Gen 7: Time
         self.temporal = TemporalPredictor()
@@ -30,77 +52,105 @@ class LifeCycle:
         # System State
         self.history_of_tasks = []
 
-    def run_cycle(self, input_event: str):
+    def _next_event(self, now: float) -> float:
+        # add_event is a write, so it must precede predict_next
+        self.temporal.add_event(now)
+        return self.temporal.predict_next()
+
+    async def run_cycle(self, input_event: str):
         """Runs one full cognitive cycle."""
         
-        # 0. Transcendent Interface (Input)
-        print(self.interface.generate_section("event", input_event, "input", "sensor"))
-        
-        # 1. Temporal Check (Gen 7)
+        # 1-3. Temporal Check (Gen 7), Spatial Memory Ingestion (Gen 8) and
+        # Orchestration (Gen 5 & 6) only share the input event, so they run concurrently.
+        # The blueprint is parsed once in __init__; the event is injected as state
+        loop = asyncio.get_running_loop()
         now = datetime.now().timestamp()
-        self.temporal.add_event(now)
-        next_event = self.temporal.predict_next()
-        print(f"  [Time] Next expected event at: {datetime.fromtimestamp(next_event).strftime('%H:%M:%S')}")
-        
-        # 2. Spatial Memory Ingestion (Gen 8)
-        node = self.memory.ingest_entry(input_event)
-        print(f"  [Space] Memorized concept: {node}")
-        
-        # 3. Orchestration (Gen 5 & 6)
-        # Dynamic blueprint generation (Mock)
-        blueprint = f"""
-        planes:
-          agentic:
-            - name: "Worker"
-              role: "Processor"
-          structural:
-            - name: "ProcessPhase"
-              steps:
-                - name: "ProcessStep"
-                  agent: "Worker"
-                  inputs: {{ "data": "{input_event}" }}
-                  outputs: "result"
-        """
-        self.orchestrator.parse_blueprint(blueprint)
-        results = self.orchestrator.execute()
+        next_event, node, results = await asyncio.gather(
+            loop.run_in_executor(None, self._next_event, now),
+            loop.run_in_executor(None, self.memory.ingest_entry, input_event),
+            loop.run_in_executor(None, self.orchestrator.execute, {"input_event": input_event}),
+        )
         
         # 4. Critical Reflection (Gen 9)
         # Extract a mock trace from orchestrator (for now we simulate it)
         trace = [{"action": "ProcessStep", "status": "success"}]
         critiques = self.critic.analyze_trace(trace)
-        if critiques:
-             print(f"  [Consciousness] Critique: {critiques[0]}")
-             
-        # 5. Output (Gen 10)
-        output_content = f"Processed '{input_event}'. Result: {results.get('result', 'Done')}"
-        print(self.interface.generate_section("response", output_content, "output", "display"))
+        
+        # 0 + 5. Transcendent Interface (Input/Output, Gen 10)
+        # One record per cycle; sections are only rendered when INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            output_content = f"Processed '{input_event}'. Result: {results.get('result', 'Done')}"
+            logger.info(
+                "%s\n  [Time] Next expected event at: %s\n  [Space] Memorized concept: %s\n  [Consciousness] Critique: %s\n%s",
+                self.interface.generate_section("event", input_event, "input", "sensor"),
+                datetime.fromtimestamp(next_event).strftime('%H:%M:%S'),
+                node,
+                critiques[0] if critiques else "-",
+                self.interface.generate_section("response", output_content, "output", "display"),
+            )
 
 from klipper_sdk.client import KlipperClient
 
+def content_fingerprint(content: str) -> bytes:
+    # 8-byte digest: debouncing keeps no reference to (possibly huge) payloads
+    return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+
+RECONNECT_DELAY = 2.0
+MAX_RECONNECT_DELAY = 60.0
+
+async def watch_clipboard(life: LifeCycle, client: KlipperClient):
+    last_hash = None
+    delay = RECONNECT_DELAY
+    while True:
+        try:
+            async for current in client.watch():
+                # A signal got through, so the connection is healthy again
+                delay = RECONNECT_DELAY
+                if not current:
+                    continue
+                current_hash = content_fingerprint(current)
+                if current_hash != last_hash:
+                    # Debounce / New Event
+                    last_hash = current_hash
+                    try:
+                        await life.run_cycle(current)
+                    except Exception:
+                        # One bad event must not stop the daemon
+                        logger.exception("Life cycle failed for clipboard event")
+        except Exception as e:
+            # Session bus lost (or Klipper gone); reopen the router with backoff
+            print(f"Error watching clipboard: {e}; reconnecting in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Routes cycle logs through a queue so stdout writes happen off the event loop."""
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
 def main():
+    listener = setup_logging()
     life = LifeCycle()
     client = KlipperClient()
-    last_content = None
     
     print("\n--- Starting Klipper SDK Life Cycle (Real-World Mode) ---\n")
     print("Listening for clipboard changes... (Ctrl+C to stop)")
     
     try:
-        while True:
-            try:
-                current = client.get_current_content()
-                if current and current != last_content:
-                    # Debounce / New Event
-                    last_content = current
-                    life.run_cycle(current)
-                
-                time.sleep(1) # Rhythm: 1Hz Polling
-            except Exception as e:
-                print(f"Error getting clipboard: {e}")
-                time.sleep(2)
-                
+        # Event-driven: wakes only on Klipper's clipboardHistoryUpdated signal
+        asyncio.run(watch_clipboard(life, client))
     except KeyboardInterrupt:
         print("\nLife Cycle Terminated.")
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
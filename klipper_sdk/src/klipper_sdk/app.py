@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, List
+import numpy as np
 from .learning import LearningManager
 
 app = FastAPI(title="Meta-AI Orchestrator API")
@@ -23,18 +24,41 @@ class UsageResponse(BaseModel):
 def health_check():
     return {"status": "online", "model": "Meta-AI Orchestrator"}
 
+# The predictors are pure in-memory computations, so the endpoints run directly
+# on the event loop instead of being dispatched to the threadpool
 @app.post("/predict/starred", response_model=StarredResponse)
-def predict_starred(request: PredictionRequest):
+async def predict_starred(request: PredictionRequest):
     # TAS 3.1: API Implementation
     prob = learning_manager.predict_starred(request.age_in_days, request.recency_score)
     return StarredResponse(uuid=request.uuid, probability=prob)
 
 @app.post("/predict/usage", response_model=UsageResponse)
-def predict_usage(request: PredictionRequest):
+async def predict_usage(request: PredictionRequest):
     # TAS 3.1: API Implementation
     usage_time = learning_manager.predict_usage(request.age_in_days)
     return UsageResponse(uuid=request.uuid, predicted_last_used_time=usage_time)
 
+# Batch variants: one request and one vectorized call for a whole history
+@app.post("/predict/starred/batch", response_model=List[StarredResponse])
+async def predict_starred_batch(requests: List[PredictionRequest]):
+    ages = np.array([r.age_in_days for r in requests], dtype=np.float64)
+    recencies = np.array([r.recency_score for r in requests], dtype=np.float64)
+    probs = learning_manager.predict_starred_batch(ages, recencies)
+    return [
+        StarredResponse(uuid=r.uuid, probability=p)
+        for r, p in zip(requests, probs.tolist())
+    ]
+
+@app.post("/predict/usage/batch", response_model=List[UsageResponse])
+async def predict_usage_batch(requests: List[PredictionRequest]):
+    ages = np.array([r.age_in_days for r in requests], dtype=np.float64)
+    usage_times = learning_manager.predict_usage_batch(ages)
+    return [
+        UsageResponse(uuid=r.uuid, predicted_last_used_time=t)
+        for r, t in zip(requests, usage_times.tolist())
+    ]
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop="auto" picks uvloop when installed (klipper-sdk[api] pulls it in via uvicorn[standard])
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto")
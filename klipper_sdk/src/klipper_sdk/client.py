@@ -1,19 +1,31 @@
-from typing import List, Optional
-from jeepney import DBusAddress, new_method_call
+from typing import AsyncIterator, List, Optional
+from jeepney import DBusAddress, HeaderFields, MatchRule, Message, MessageType, message_bus, new_method_call
 from jeepney.io.blocking import open_dbus_connection
+from jeepney.io.asyncio import open_dbus_router, Proxy
 
 from .models import ClipboardItem
 
+def _history_item_calls(address: DBusAddress, limit: int) -> List[Message]:
+    return [new_method_call(address, "getClipboardHistoryItem", "i", (i,)) for i in range(limit)]
+
 class KlipperClient:
     """A client to interact with the KDE Klipper D-Bus service."""
     
     BUS_NAME = "org.kde.klipper"
     OBJECT_PATH = "/klipper"
     INTERFACE = "org.kde.klipper.klipper"
+    HISTORY_LIMIT = 20  # Reasonable limit for now
+
+    # Shared by all instances. Messages carry no serial until sent, so the
+    # argument-free (or fixed-argument) calls are built once at import
+    _address = DBusAddress(OBJECT_PATH, bus_name=BUS_NAME, interface=INTERFACE)
+    _msg_get = new_method_call(_address, "getClipboardContents")
+    _msg_clear = new_method_call(_address, "clearClipboardHistory")
+    _msg_history_menu = new_method_call(_address, "getClipboardHistoryMenu")
+    _history_calls = _history_item_calls(_address, HISTORY_LIMIT)
 
     def __init__(self):
         self._connection = None
-        self._address = DBusAddress(self.OBJECT_PATH, bus_name=self.BUS_NAME, interface=self.INTERFACE)
 
     def _get_connection(self):
         if self._connection is None:
@@ -23,38 +35,99 @@ class KlipperClient:
     def get_current_content(self) -> Optional[str]:
         """Retrieves the current clipboard content."""
         try:
-            msg = new_method_call(self._address, "getClipboardContents")
-            reply = self._get_connection().send_and_get_reply(msg)
-            return reply[0]
-        except Exception:
+            reply = self._get_connection().send_and_get_reply(self._msg_get)
+        except ConnectionError:
+            # Session bus connection dropped; reconnect once
+            self._connection = None
+            reply = self._get_connection().send_and_get_reply(self._msg_get)
+        if reply.header.message_type == MessageType.error:
             return None
+        return reply.body[0]
+
+    async def watch(self) -> AsyncIterator[str]:
+        """Yields the current clipboard content each time Klipper reports a history change.
+
+        Driven by the 'clipboardHistoryUpdated' signal instead of polling. Signals that
+        arrive while the consumer is busy are coalesced, since the content is re-read
+        on every wakeup anyway.
+        """
+        # The bus daemon resolves the well-known name in AddMatch, but signals are
+        # stamped with Klipper's unique name (":1.N"), so the local filter must not
+        # match on sender
+        match = dict(
+            type="signal",
+            path=self.OBJECT_PATH,
+            interface=self.INTERFACE,
+            member="clipboardHistoryUpdated",
+        )
+        bus_rule = MatchRule(sender=self.BUS_NAME, **match)
+        local_rule = MatchRule(**match)
+        async with open_dbus_router(bus='SESSION') as router:
+            await Proxy(message_bus, router).AddMatch(bus_rule)
+            with router.filter(local_rule, bufsize=1) as signals:
+                while True:
+                    await signals.get()
+                    reply = await router.send_and_get_reply(self._msg_get)
+                    if reply.header.message_type == MessageType.error:
+                        continue
+                    yield reply.body[0]
 
     def set_clipboard(self, text: str) -> None:
         """Sets the current system clipboard content."""
         msg = new_method_call(self._address, "setClipboardContents", "s", (text,))
         self._get_connection().send_and_get_reply(msg)
 
+    def _call_pipelined(self, messages: List[Message]) -> List[Message]:
+        """Sends all method calls before reading any reply, so N calls cost one round-trip."""
+        conn = self._get_connection()
+        serials = []
+        for msg in messages:
+            serial = next(conn.outgoing_serial)
+            conn.send(msg, serial=serial)
+            serials.append(serial)
+        
+        pending = set(serials)
+        replies = {}
+        while pending:
+            msg_in = conn.receive()
+            reply_to = msg_in.header.fields.get(HeaderFields.reply_serial)
+            if reply_to in pending:
+                pending.discard(reply_to)
+                replies[reply_to] = msg_in
+        return [replies[serial] for serial in serials]
+
     def get_history(self) -> List[ClipboardItem]:
         """Retrieves the full clipboard history."""
-        # Klipper doesn't have a direct 'get all' but we can iterate or use getClipboardHistoryMenu
-        # For this SDK, we'll try to fetch items by index until we hit an error or empty
+        # getClipboardHistoryMenu returns the whole history in one call
+        try:
+            reply = self._get_connection().send_and_get_reply(self._msg_history_menu)
+        except Exception:
+            return []
+        if reply.header.message_type == MessageType.error:
+            # Older Klipper without the method; fall back to per-index calls
+            return self._get_history_by_index()
+        return [ClipboardItem.from_raw(i, content) for i, content in enumerate(reply.body[0]) if content]
+
+    def _get_history_by_index(self) -> List[ClipboardItem]:
+        # Fetch items by index until we hit an error or empty.
+        # All index requests are pipelined instead of waiting on each reply in turn.
         history = []
-        for i in range(20):  # Reasonable limit for now
-            try:
-                msg = new_method_call(self._address, "getClipboardHistoryItem", "i", (i,))
-                reply = self._get_connection().send_and_get_reply(msg)
-                content = reply[0]
-                if not content:
-                    break
-                history.append(ClipboardItem.from_raw(i, content))
-            except Exception:
+        try:
+            replies = self._call_pipelined(self._history_calls)
+        except Exception:
+            return history
+        for i, reply in enumerate(replies):
+            if reply.header.message_type == MessageType.error:
+                break
+            content = reply.body[0]
+            if not content:
                 break
+            history.append(ClipboardItem.from_raw(i, content))
         return history
 
     def clear_history(self) -> None:
         """Clears the entire clipboard history."""
-        msg = new_method_call(self._address, "clearClipboardHistory")
-        self._get_connection().send_and_get_reply(msg)
+        self._get_connection().send_and_get_reply(self._msg_clear)
 
     def select_item(self, index: int) -> None:
         """Selects a history item by index and makes it active."""
@@ -1,8 +1,51 @@
+import heapq
 import re
-from typing import List, Optional, Dict
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Dict, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+_URL_PREFIXES = ('http://', 'https://')
+_CODE_RE = re.compile(r'def |class |import |return |SELECT |FROM |[{};]')
+# Two anchored searches instead of one 'SELECT.*FROM' pattern, which backtracks
+# quadratically on texts with many SELECTs and no FROM
+_SELECT_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+_FROM_RE = re.compile(r'\bFROM\b', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Texts longer than this are classified without memoizing, so the LRU below
+# never holds large clipboard payloads alive
+_CACHED_TEXT_LIMIT = 4096
+
+@lru_cache(maxsize=10_000)
+def _classify(text: str) -> str:
+    """Content type of a non-empty text.
+
+    Memoized on the text alone: predict_workflow re-reads the same recent items
+    on every call, and analyzers share results for identical content.
+    """
+    text = text.strip()
+    
+    # URL detection
+    if text.startswith(_URL_PREFIXES):
+        return "url"
+    
+    # Code detection (heuristic)
+    if _CODE_RE.search(text) and len(text.splitlines()) > 1:
+        return "code_snippet"
+        
+    # SQL detection: a FROM anywhere after the first SELECT
+    select = _SELECT_RE.search(text)
+    if select is not None and _FROM_RE.search(text, select.end()) is not None:
+        return "sql_query"
+
+    # Email detection
+    if _EMAIL_RE.search(text):
+        return "email"
+
+    return "text"
+
 class ClipboardItem(BaseModel):
     """Represents an item from the clipboard database."""
     uuid: str
@@ -29,90 +72,62 @@ class ClipboardAnalyzer:
         self.items: List[ClipboardItem] = []
 
     def ingest_items(self, items: List[ClipboardItem]):
-        """Load clipboard items into the analyzer."""
-        self.items.extend(items)
-        # Sort by added_time descending (newest first)
-        self.items.sort(key=lambda x: x.added_time, reverse=True)
+        """Load clipboard items into the analyzer.
+
+        Any object with uuid/added_time/text works, e.g. etl.RowMainRaw rows.
+        """
+        # self.items is kept sorted by added_time descending (newest first), so only
+        # the new batch needs sorting; ties keep existing items ahead of new ones
+        batch = sorted(items, key=lambda x: x.added_time, reverse=True)
+        self.items = list(heapq.merge(self.items, batch, key=lambda x: -x.added_time))
 
     def analyze_content_type(self, item: ClipboardItem) -> str:
         """Determine the primary type of content."""
-        if not item.text:
+        text = item.text
+        if not text:
             return "binary"
-        
-        text = item.text.strip()
-        
-        # URL detection
-        if re.match(r'^https?://', text):
-            return "url"
-        
-        # Code detection (heuristic)
-        code_indicators = ['def ', 'class ', 'import ', 'return ', '{', '}', ';', 'SELECT ', 'FROM ']
-        if any(ind in text for ind in code_indicators) and len(text.splitlines()) > 1:
-            return "code_snippet"
-            
-        # SQL detection
-        if "SELECT" in text.upper() and "FROM" in text.upper():
-            return "sql_query"
+        if len(text) <= _CACHED_TEXT_LIMIT:
+            return _classify(text)
+        return _classify.__wrapped__(text)
 
-        # Email detection
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
-            return "email"
+    def cluster_by_time(self, threshold_seconds: float = 60.0) -> List[Tuple[int, int]]:
+        """Group items that were added within a short time window.
 
-        return "text"
-
-    def cluster_by_time(self, threshold_seconds: float = 60.0) -> List[List[ClipboardItem]]:
-        """Group items that were added within a short time window."""
+        Returns (start, end) index pairs into self.items; use self.items[start:end]
+        to get a cluster's items.
+        """
         if not self.items:
             return []
 
-        clusters = []
-        current_cluster = [self.items[0]]
-        
-        for i in range(1, len(self.items)):
-            prev_item = self.items[i-1]
-            curr_item = self.items[i]
-            
-            # Note: items are sorted newest first, so prev_item is newer than curr_item
-            time_diff = prev_item.added_time - curr_item.added_time
-            
-            if time_diff <= threshold_seconds:
-                current_cluster.append(curr_item)
-            else:
-                clusters.append(current_cluster)
-                current_cluster = [curr_item]
+        # Items are sorted newest first, so consecutive gaps are non-negative
+        times = [item.added_time for item in self.items]
+        breaks = [i for i in range(1, len(times)) if times[i - 1] - times[i] > threshold_seconds]
         
-        clusters.append(current_cluster)
-        return clusters
+        return list(zip([0] + breaks, breaks + [len(self.items)]))
 
     def predict_workflow(self, recent_count: int = 5) -> WorkflowPrediction:
         """Predict the user's workflow based on recent items."""
         if not self.items:
             return WorkflowPrediction(name="Unknown", confidence=0.0, reasoning="No data")
 
-        recent_items = self.items[:recent_count]
-        types = [self.analyze_content_type(item) for item in recent_items]
-        
-        type_counts = {}
-        for t in types:
-            type_counts[t] = type_counts.get(t, 0) + 1
-            
-        total = len(recent_items)
+        total = min(recent_count, len(self.items))
+        type_counts = Counter(self.analyze_content_type(item) for item in islice(self.items, total))
         
-        if type_counts.get('url', 0) / total >= 0.6:
+        if type_counts['url'] / total >= 0.6:
             return WorkflowPrediction(
                 name="Research", 
                 confidence=0.8, 
-                reasoning=f"Majority of recent items ({type_counts.get('url')} of {total}) are URLs."
+                reasoning=f"Majority of recent items ({type_counts['url']} of {total}) are URLs."
             )
             
-        if type_counts.get('code_snippet', 0) / total >= 0.4 or type_counts.get('sql_query', 0) > 0:
+        if type_counts['code_snippet'] / total >= 0.4 or type_counts['sql_query'] > 0:
              return WorkflowPrediction(
                 name="Development", 
                 confidence=0.7, 
                 reasoning="Recent items contain code snippets or SQL queries."
             )
 
-        if type_counts.get('email', 0) > 0:
+        if type_counts['email'] > 0:
              return WorkflowPrediction(
                 name="Communication", 
                 confidence=0.6, 
@@ -1,6 +1,6 @@
 import json
 import sqlite3
-import pandas as pd
+from dataclasses import dataclass
 from typing import List, Optional, Dict
 from pydantic import BaseModel, Field
 
@@ -12,6 +12,21 @@ class RowMain(BaseModel):
     text: Optional[str] = None
     starred: bool = False
 
+@dataclass(frozen=True)
+class RowMainRaw:
+    """Slotted, validation-free row for internal pipeline use.
+
+    Produced by ETLPipeline from already-sanitized values; RowMain remains the
+    validating model for external input.
+    """
+    __slots__ = ("uuid", "added_time", "last_used_time", "mimetypes", "text", "starred")
+    uuid: str
+    added_time: float
+    last_used_time: Optional[float]
+    mimetypes: List[str]
+    text: Optional[str]
+    starred: bool
+
 class ETLPipeline:
     def __init__(self, db_path: str = ":memory:"):
         self.conn = sqlite3.connect(db_path)
@@ -29,29 +44,27 @@ class ETLPipeline:
         except json.JSONDecodeError:
             return [mt_string] if mt_string else []
 
-    def ingest_main(self) -> List[RowMain]:
+    def ingest_main(self) -> List[RowMainRaw]:
         query = "SELECT uuid, added_time, last_used_time, mimetypes, text, starred FROM main"
-        df = pd.read_sql_query(query, self.conn)
+        # Straight from the cursor in batches; no intermediate DataFrame
+        cursor = self.conn.execute(query)
+        cursor.arraysize = 1024
         
-        # TAS 1.2: Validate constraints (added_time > 0, last_used_time > 0)
-        # Using handle NULL for last_used_time
         rows = []
-        for _, row in df.iterrows():
-            mimetypes = self.normalize_mimetypes(row['mimetypes'])
-            
-            # TAS 1.4: Handle NULL in last_used_time
-            last_used = row['last_used_time']
-            if pd.isna(last_used) or last_used <= 0:
-                last_used = None
-            
-            rows.append(RowMain(
-                uuid=row['uuid'],
-                added_time=max(0.1, row['added_time']), # Constraint validation
-                last_used_time=last_used,
-                mimetypes=mimetypes,
-                text=row['text'],
-                starred=bool(row['starred'])
-            ))
+        while batch := cursor.fetchmany():
+            for uuid, added_time, last_used, mimetypes, text, starred in batch:
+                # TAS 1.4: Handle NULL in last_used_time
+                last_used = float(last_used) if last_used is not None and last_used > 0 else None
+                
+                # TAS 1.2: Values are sanitized here, so skip per-row validation
+                rows.append(RowMainRaw(
+                    uuid,
+                    max(0.1, float(added_time)), # Constraint validation
+                    last_used,
+                    self.normalize_mimetypes(mimetypes),
+                    text,
+                    bool(starred)
+                ))
         return rows
 
 if __name__ == "__main__":
@@ -27,12 +27,9 @@ class Holon(Agent):
         """
         print(f"[{self.name}] Activating Holonic State... Spawning internal orchestration.")
         
-        # Pass the outer context to the inner orchestrator
-        # The internal orchestrator expects a dictionary context
-        internal_context = context.copy() if context else {}
-        
-        # Execute the internal blueprint
-        results = self.internal_orchestrator.execute(dynamic_context=internal_context)
+        # Pass the outer context to the inner orchestrator as-is; it seeds its own
+        # workflow state from a copy, so the caller's dict is never mutated
+        results = self.internal_orchestrator.execute(dynamic_context=context)
         
         # Synthesize the results back into a single string response
         summary = f"Holon {self.name} completed sub-workflow. Results: {results}"
@@ -8,26 +8,28 @@ class SpaceInterface:
     Format: ⫻{name}/{type}:{place}/{index}
     """
     
-    SPACE_PATTERN = re.compile(r"^⫻([a-z0-9_-]+)(?:/([a-z0-9_-]+))?(?::([a-z0-9_-]+))?(?:/([a-z0-9_-]+))?$", re.MULTILINE)
+    # Only ever matched against the header line, so no MULTILINE or anchors needed
+    SPACE_PATTERN = re.compile(r"⫻([a-z0-9_-]+)(?:/([a-z0-9_-]+))?(?::([a-z0-9_-]+))?(?:/([a-z0-9_-]+))?")
 
     def parse_section(self, text: str) -> Dict[str, str]:
         """
         Parses a Space format section header.
         Example: ⫻content/meta-summary:cell/0
         """
-        lines = text.strip().split('\n')
-        header = lines[0]
-        match = self.SPACE_PATTERN.match(header)
+        # Split off the header only; the body is never scanned line by line
+        header, _, content = text.strip().partition('\n')
+        match = self.SPACE_PATTERN.fullmatch(header)
         
         if not match:
             return {"error": "Invalid Space Header"}
             
+        name, type_, place, index = match.groups()
         return {
-            "name": match.group(1),
-            "type": match.group(2),
-            "place": match.group(3),
-            "index": match.group(4),
-            "content": "\n".join(lines[1:])
+            "name": name,
+            "type": type_,
+            "place": place,
+            "index": index,
+            "content": content
         }
         
     def generate_section(self, name: str, content: str, type_: str = None, place: str = None, index: str = None) -> str:
@@ -1,12 +1,14 @@
+import bisect
+import math
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 import pandas as pd
 import numpy as np
 # from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 # from sklearn.model_selection import train_test_split
 # from sklearn.preprocessing import MultiLabelBinarizer
 
-from .etl import RowMain
+from .etl import RowMain, RowMainRaw
 
 class ModelFeatures(pd.DataFrame):
     """Container for engineered features."""
@@ -18,21 +20,26 @@ class LearningManager:
         self.model_starred = None
         self.model_usage = None
 
-    def engineer_features(self, rows: List[RowMain]) -> pd.DataFrame:
+    def engineer_features(self, rows: List[Union[RowMain, RowMainRaw]]) -> pd.DataFrame:
         now = datetime.now().timestamp()
+        n = len(rows)
         
-        data = []
-        for r in rows:
-            data.append({
-                "uuid": r.uuid,
-                "age_in_days": (now - r.added_time) / (24 * 3600),
-                "recency_score": (now - r.last_used_time) / (24 * 3600) if r.last_used_time else 999.0,
-                "mimetypes": r.mimetypes,
-                "starred": int(r.starred),
-                "last_used_time": r.last_used_time or 0.0
-            })
+        # Column-wise extraction; the day arithmetic then runs once per column
+        added = np.fromiter((r.added_time for r in rows), dtype=np.float64, count=n)
+        last = np.fromiter((r.last_used_time or 0.0 for r in rows), dtype=np.float64, count=n)
+        starred = np.fromiter((r.starred for r in rows), dtype=np.int64, count=n)
+        # Blend with the 999.0 "never used" sentinel arithmetically instead of np.where
+        has_last = last != 0.0
+        recency = has_last * ((now - last) / (24 * 3600)) + ~has_last * 999.0
         
-        df = pd.DataFrame(data)
+        df = pd.DataFrame({
+            "uuid": [r.uuid for r in rows],
+            "age_in_days": (now - added) / (24 * 3600),
+            "recency_score": recency,
+            "mimetypes": [r.mimetypes for r in rows],
+            "starred": starred,
+            "last_used_time": last
+        })
         
         # TAS 2.1: Simple encoding for mimetypes (dimensionality reduction if needed later)
         # Note: In a real scenario, use MultiLabelBinarizer or embeddings
@@ -50,6 +57,11 @@ class LearningManager:
         # Mock prediction
         return 0.75
 
+    def predict_starred_batch(self, ages: np.ndarray, recencies: np.ndarray) -> np.ndarray:
+        """Vectorized predict_starred over aligned age/recency arrays."""
+        # Mock prediction
+        return np.full(len(ages), 0.75)
+
     
     def predict_usage(self, age: float, history: Optional[List[float]] = None) -> float:
         """
@@ -62,6 +74,10 @@ class LearningManager:
         predictor.history = sorted(history)
         return predictor.predict_next()
 
+    def predict_usage_batch(self, ages: np.ndarray) -> np.ndarray:
+        """Vectorized predict_usage for items without usage history."""
+        return np.full(len(ages), datetime.now().timestamp() + 3600)
+
 class TemporalPredictor:
     """
     Gen 7: Temporal Layer.
@@ -69,10 +85,16 @@ class TemporalPredictor:
     """
     def __init__(self):
         self.history = []
+        # Last prediction; valid until the next add_event or until it lies in the past
+        self._cached_next: Optional[float] = None
 
     def add_event(self, timestamp: float):
-        self.history.append(timestamp)
-        self.history.sort()
+        self._cached_next = None
+        # Events normally arrive in order, so appending keeps history sorted
+        if self.history and timestamp < self.history[-1]:
+            bisect.insort(self.history, timestamp)
+        else:
+            self.history.append(timestamp)
 
     def predict_next(self) -> float:
         """
@@ -82,19 +104,21 @@ class TemporalPredictor:
             # Default to 1 hour from now if insufficient data
             return datetime.now().timestamp() + 3600
             
-        intervals = [t2 - t1 for t1, t2 in zip(self.history[:-1], self.history[1:])]
-        avg_interval = sum(intervals) / len(intervals)
-        
+        now = datetime.now().timestamp()
+        if self._cached_next is not None and self._cached_next >= now:
+            return self._cached_next
+            
+        # The intervals of a sorted history telescope to last - first
         last_event = self.history[-1]
+        avg_interval = (last_event - self.history[0]) / (len(self.history) - 1)
         next_event = last_event + avg_interval
         
         # Ensure prediction is in the future
-        now = datetime.now().timestamp()
-        if next_event < now:
-            # If the predicted time is already past, project forward by intervals
-            while next_event < now:
-                next_event += avg_interval
+        if next_event < now and avg_interval > 0:
+            # If the predicted time is already past, project forward by whole intervals
+            next_event += math.ceil((now - next_event) / avg_interval) * avg_interval
                 
+        self._cached_next = next_event
         return next_event
 
 if __name__ == "__main__":
@@ -1,8 +1,68 @@
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Any
 from .tools import Tool
 from .models import ClipboardItem
 
+_URL_PREFIXES = ('http://', 'https://')
+_SQL_KEYWORDS = ("SELECT ", "INSERT INTO ", "UPDATE ", "DELETE FROM ", "CREATE TABLE", "ALTER TABLE")
+_PYTHON_KEYWORDS = ("def ", "import ", "class ", "print(", "__name__", "if __name__", "pandas", "numpy")
+_FRONTEND_KEYWORDS = ("import React", "export const", "interface ", "function ", "console.log", "<div>", "className=")
+_CSS_KEYWORDS = ("margin:", "padding:", "color:", "background:", "display:")
+_SHELL_KEYWORDS = ("sudo ", "npm install", "pip install", "docker ", "kubectl ", "git ")
+# Code indicators: single characters (dropped in one translate pass) plus 'return'
+_DROP_CODE_CHARS = str.maketrans('', '', '{};()[]=')
+# Every boundary str.splitlines() splits on; found without building the line list
+_LINE_BREAK_RE = re.compile('[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+
+_CACHED_TEXT_LIMIT = 4096
+
+@lru_cache(maxsize=10_000)
+def _classify(text: str) -> str:
+    """Pure classification of a non-empty text; cached since clipboard content repeats."""
+    text = text.strip()
+
+    # Single tokens (words, ids, numbers) can't match any rule below: every one
+    # needs whitespace or punctuation
+    if text.isalnum(): return "text"
+
+    # URL Detection
+    if text.startswith(_URL_PREFIXES): return "url"
+
+    # SQL
+    upper = text.upper()
+    if "FROM" in upper and any(k in upper for k in _SQL_KEYWORDS):
+        return "sql_query"
+
+    # Python
+    if any(k in text for k in _PYTHON_KEYWORDS):
+        if ":" in text or "=" in text: 
+            return "python_code"
+
+    # Frontend (React/TS/JS)
+    if any(k in text for k in _FRONTEND_KEYWORDS):
+        return "frontend_code"
+
+    # CSS
+    if "{" in text and "}" in text and ":" in text and ";" in text and not "function" in text:
+        if any(k in text for k in _CSS_KEYWORDS):
+            return "css_style"
+
+    # Shell/Bash
+    if text.startswith("#!") or any(k in text for k in _SHELL_KEYWORDS):
+        return "shell_command"
+
+    # JSON
+    if text.startswith("{") and text.endswith("}") and '"' in text:
+        return "json_data"
+
+    # Default Code fallback
+    if _LINE_BREAK_RE.search(text) and len(text) - len(text.translate(_DROP_CODE_CHARS)) + text.count('return') > 3:
+        return "code_snippet"
+
+    return "text"
+
 # Re-using the robust logic we created in backend/main.py, but encapsulated in a Tool
 class ContentAnalysisTool(Tool):
     """Tool to analyze the content type of a text string."""
@@ -30,43 +90,11 @@ class ContentAnalysisTool(Tool):
             text = str(item)
 
         if not text: return "binary"
-        text = text.strip()
-        
-        # URL Detection
-        if re.match(r'^https?://', text): return "url"
-        
-        # SQL
-        if any(k in text.upper() for k in ["SELECT ", "INSERT INTO ", "UPDATE ", "DELETE FROM ", "CREATE TABLE", "ALTER TABLE"]) and "FROM" in text.upper():
-            return "sql_query"
-            
-        # Python
-        if any(k in text for k in ["def ", "import ", "class ", "print(", "__name__", "if __name__", "pandas", "numpy"]):
-            if ":" in text or "=" in text: 
-                return "python_code"
-
-        # Frontend (React/TS/JS)
-        if any(k in text for k in ["import React", "export const", "interface ", "function ", "console.log", "<div>", "className="]):
-            return "frontend_code"
-            
-        # CSS
-        if "{" in text and "}" in text and ":" in text and ";" in text and not "function" in text:
-            if any(k in text for k in ["margin:", "padding:", "color:", "background:", "display:"]):
-                return "css_style"
-
-        # Shell/Bash
-        if text.startswith("#!") or any(k in text for k in ["sudo ", "npm install", "pip install", "docker ", "kubectl ", "git "]):
-            return "shell_command"
-
-        # JSON
-        if text.startswith("{") and text.endswith("}") and '"' in text:
-            return "json_data"
-            
-        # Default Code fallback
-        code_indicators = ['{', '}', ';', '(', ')', '[', ']', '=', 'return']
-        if len(text.splitlines()) > 1 and sum(text.count(c) for c in code_indicators) > 3:
-             return "code_snippet"
-
-        return "text"
+        # Short texts go through the cache; long ones bypass it so the LRU never
+        # keeps large clipboard payloads alive as keys
+        if len(text) <= _CACHED_TEXT_LIMIT:
+            return _classify(text)
+        return _classify.__wrapped__(text)
 
 class WorkflowPredictionTool(Tool):
     """Tool to predict workflow based on content types."""
@@ -77,6 +105,17 @@ class WorkflowPredictionTool(Tool):
             description="Predict workflow from a list of content types. Args: types (List[str]), texts (optional List[str])"
         )
 
+    # Workflow score contributions per content type
+    _TYPE_WEIGHTS = {
+        "frontend_code": (("Frontend Development", 3.0),),
+        "css_style": (("Frontend Development", 2.0),),
+        "python_code": (("Backend Development", 2.0), ("Data Science", 1.0)),
+        "sql_query": (("Backend Development", 2.0), ("Data Science", 2.5)),
+        "shell_command": (("DevOps/SRE", 3.0), ("Backend Development", 1.0)),
+        "json_data": (("Backend Development", 1.0), ("Frontend Development", 1.0)),
+        "url": (("Research", 1.5),),
+    }
+
     def run(self, types: List[str], texts: List[str] = None) -> Dict[str, Any]:
         # Scores
         scores = {
@@ -87,15 +126,10 @@ class WorkflowPredictionTool(Tool):
             "Research": 0.0
         }
         
-        # Weighting logic
-        for t in types:
-            if t == "frontend_code": scores["Frontend Development"] += 3.0
-            elif t == "css_style": scores["Frontend Development"] += 2.0
-            elif t == "python_code": scores["Backend Development"] += 2.0; scores["Data Science"] += 1.0
-            elif t == "sql_query": scores["Backend Development"] += 2.0; scores["Data Science"] += 2.5
-            elif t == "shell_command": scores["DevOps/SRE"] += 3.0; scores["Backend Development"] += 1.0
-            elif t == "json_data": scores["Backend Development"] += 1.0; scores["Frontend Development"] += 1.0
-            elif t == "url": scores["Research"] += 1.5
+        # Weighting logic: each distinct type is weighted once, scaled by its count
+        for t, count in Counter(types).items():
+            for workflow, weight in self._TYPE_WEIGHTS.get(t, ()):
+                scores[workflow] += weight * count
         
         # Secondary pass if texts provided
         if texts:
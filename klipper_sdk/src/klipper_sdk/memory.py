@@ -1,5 +1,9 @@
 from typing import Dict, List, Optional, Any
-import uuid
+import hashlib
+import itertools
+import json
+import os
+import threading
 import numpy as np
 try:
     from sentence_transformers import SentenceTransformer
@@ -7,10 +11,55 @@ try:
 except ImportError:
     HAS_EMBEDDINGS = False
 
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+# int8-quantized ONNX export shipped with the model; needs sentence-transformers>=3.2 and onnxruntime
+EMBEDDING_ONNX_FILE = 'onnx/model_quint8_avx2.onnx'
+
+# The model is loaded at most once per process and shared by every SpatialMemory
+_encoder = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+def _load_encoder():
+    try:
+        return SentenceTransformer(EMBEDDING_MODEL, backend="onnx", model_kwargs={"file_name": EMBEDDING_ONNX_FILE})
+    except Exception:
+        # Older sentence-transformers or no onnxruntime: default PyTorch backend
+        return SentenceTransformer(EMBEDDING_MODEL)
+
+def _get_encoder():
+    """Returns the shared embedding model, or None if it is unavailable."""
+    global _encoder, _encoder_loaded
+    if _encoder_loaded:
+        return _encoder
+    with _encoder_lock:
+        if not _encoder_loaded:
+            if HAS_EMBEDDINGS:
+                print(f"[SpatialMemory] Loading embedding model ({EMBEDDING_MODEL})...")
+                try:
+                    _encoder = _load_encoder()
+                except Exception as e:
+                    print(f"[SpatialMemory] Failed to load model: {e}")
+            else:
+                print("[SpatialMemory] 'sentence-transformers' not found. Semantic features disabled.")
+            _encoder_loaded = True
+    return _encoder
+
+def _content_key(content: str) -> bytes:
+    return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+def _normalized(vector: np.ndarray) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
 class MemoryNode:
     """A node in the spatial memory graph."""
+    # Process-wide id source; ids are unique per process, not across runs
+    _next_id = itertools.count()
+
     def __init__(self, content: str, node_type: str = "concept", vector: Optional[np.ndarray] = None):
-        self.id = str(uuid.uuid4())
+        self.id = next(MemoryNode._next_id)
         self.content = content
         self.node_type = node_type
         self.vector = vector
@@ -21,7 +70,7 @@ class MemoryNode:
 
 class MemoryEdge:
     """A relationship between two nodes."""
-    def __init__(self, source_id: str, target_id: str, relation: str, weight: float = 1.0):
+    def __init__(self, source_id: int, target_id: int, relation: str, weight: float = 1.0):
         self.source_id = source_id
         self.target_id = target_id
         self.relation = relation
@@ -31,49 +80,158 @@ class SpatialMemory:
     """
     Gen 8: The Spatial Layer (Topology + Semantics).
     Maps relationships between data points in a persistent graph using Vector Embeddings.
+
+    With persist_dir, embedded nodes survive restarts: the similarity matrix is a
+    memory-mapped file and node metadata an append-only log, so a warm start
+    re-embeds nothing. Edges are not persisted.
     """
-    def __init__(self):
-        self.nodes: Dict[str, MemoryNode] = {}
-        self.edges: List[MemoryEdge] = []
+    def __init__(self, persist_dir: Optional[str] = None):
+        self.nodes: Dict[int, MemoryNode] = {}
         
-        self.model = None
-        if HAS_EMBEDDINGS:
-            print("[SpatialMemory] Loading embedding model (all-MiniLM-L6-v2)...")
-            try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
-            except Exception as e:
-                print(f"[SpatialMemory] Failed to load model: {e}")
-        else:
-            print("[SpatialMemory] 'sentence-transformers' not found. Semantic features disabled.")
+        # Edges as parallel arrays over integer node indices rather than one object per edge
+        self.node_idx: Dict[int, int] = {}
+        self._indexed_nodes: List[MemoryNode] = []
+        self._relations: List[str] = []
+        self._relation_codes: Dict[str, int] = {}
+        self._edge_count = 0
+        self._edge_src = np.empty(64, dtype=np.int32)
+        self._edge_dst = np.empty(64, dtype=np.int32)
+        self._edge_rel = np.empty(64, dtype=np.int16)
+        self._edge_w = np.empty(64, dtype=np.float32)
+        
+        # Unit-normalized embeddings, one row per embedded node (in insertion order),
+        # so a similarity query is a single matrix-vector product
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_nodes: List[MemoryNode] = []
+        
+        # Embeddings by content digest; recurring clipboard entries skip the model
+        self._vec_cache: Dict[bytes, np.ndarray] = {}
+        
+        self._persist_dir = persist_dir
+        self._node_log = None
+        if persist_dir:
+            self._load(persist_dir)
+        
+        self.model = _get_encoder()
+
+    def _load(self, persist_dir: str):
+        os.makedirs(persist_dir, exist_ok=True)
+        meta_path = os.path.join(persist_dir, "meta.json")
+        log_path = os.path.join(persist_dir, "nodes.ndjson")
+        if os.path.exists(meta_path) and os.path.exists(log_path):
+            with open(meta_path, encoding="utf-8") as f:
+                dim = json.load(f)["dim"]
+            vectors_path = os.path.join(persist_dir, "vectors.f32")
+            capacity = os.path.getsize(vectors_path) // (4 * dim)
+            # Mapped, not read: pages are loaded lazily on first query
+            self._matrix = np.memmap(vectors_path, dtype=np.float32, mode="r+", shape=(capacity, dim))
+            with open(log_path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+            for row, record in enumerate(records[:capacity]):
+                vector = self._matrix[row]
+                # Restored nodes get fresh ids; nothing persisted refers to old ones
+                node = MemoryNode(record["content"], record["node_type"], vector)
+                self.nodes[node.id] = node
+                self._matrix_nodes.append(node)
+                self._vec_cache[_content_key(node.content)] = vector
+        self._node_log = open(log_path, "a", encoding="utf-8")
+
+    def close(self):
+        """Flushes persisted state to disk; only needed with persist_dir."""
+        if isinstance(self._matrix, np.memmap):
+            self._matrix.flush()
+        if self._node_log:
+            self._node_log.close()
+            self._node_log = None
         
     def add_node(self, content: str, node_type: str = "fact") -> MemoryNode:
         vector = None
         if self.model:
-            vector = self.model.encode(content)
-            
+            key = _content_key(content)
+            vector = self._vec_cache.get(key)
+            if vector is None:
+                vector = self._vec_cache[key] = self.model.encode(content)
+        return self._insert(content, node_type, vector)
+
+    def add_nodes(self, contents: List[str], node_type: str = "fact") -> List[MemoryNode]:
+        """Adds several nodes, embedding all contents in a single batched encode call."""
+        return [self._insert(content, node_type, vector)
+                for content, vector in zip(contents, self._encode_many(contents))]
+
+    def _encode_many(self, contents: List[str]) -> List[Optional[np.ndarray]]:
+        if not self.model or not contents:
+            return [None] * len(contents)
+        keys = [_content_key(content) for content in contents]
+        # Encode only unseen contents, each once, in one batch
+        missing = {key: content for key, content in zip(keys, contents) if key not in self._vec_cache}
+        if missing:
+            vectors = self.model.encode(list(missing.values()), batch_size=64, convert_to_numpy=True)
+            self._vec_cache.update(zip(missing, vectors))
+        return [self._vec_cache[key] for key in keys]
+
+    def _insert(self, content: str, node_type: str, vector: Optional[np.ndarray]) -> MemoryNode:
         node = MemoryNode(content, node_type, vector)
         self.nodes[node.id] = node
+        if vector is not None:
+            self._append_row(vector, node)
         return node
+
+    def _append_row(self, vector: np.ndarray, node: MemoryNode):
+        count = len(self._matrix_nodes)
+        if self._matrix is None:
+            self._matrix = self._allocate_matrix(16, len(vector))
+        elif count == len(self._matrix):
+            # Double on full to amortize reallocation
+            grown = self._allocate_matrix(2 * count, self._matrix.shape[1])
+            if not isinstance(grown, np.memmap):
+                grown[:count] = self._matrix
+            self._matrix = grown
+        self._matrix[count] = _normalized(vector)
+        self._matrix_nodes.append(node)
+        if self._node_log:
+            self._node_log.write(json.dumps({"content": node.content, "node_type": node.node_type}) + "\n")
+            self._node_log.flush()
+
+    def _allocate_matrix(self, rows: int, dim: int) -> np.ndarray:
+        if not self._persist_dir:
+            return np.empty((rows, dim), dtype=np.float32)
+        vectors_path = os.path.join(self._persist_dir, "vectors.f32")
+        if self._matrix is None:
+            with open(os.path.join(self._persist_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"dim": dim}, f)
+            return np.memmap(vectors_path, dtype=np.float32, mode="w+", shape=(rows, dim))
+        # r+ with a larger shape extends the file in place; existing rows are kept
+        self._matrix.flush()
+        return np.memmap(vectors_path, dtype=np.float32, mode="r+", shape=(rows, dim))
         
     def find_similar(self, text: str, top_k: int = 3) -> List[MemoryNode]:
         """Finds semantically similar nodes."""
         if not self.model or not self.nodes:
             return []
             
-        query_vector = self.model.encode(text)
+        return self._similar_to(self.model.encode(text), top_k)
+
+    def _similar_to(self, query_vector: Optional[np.ndarray], top_k: int) -> List[MemoryNode]:
+        if query_vector is None:
+            return []
+            
+        count = len(self._matrix_nodes)
+        if count == 0:
+            return []
+            
+        # Cosine similarity against every stored row at once
+        similarities = self._matrix[:count] @ _normalized(query_vector)
         
-        results = []
-        for node in self.nodes.values():
-            if node.vector is not None:
-                # Cosine similarity
-                similarity = np.dot(query_vector, node.vector) / (
-                    np.linalg.norm(query_vector) * np.linalg.norm(node.vector)
-                )
-                results.append((similarity, node))
-                
-        # Sort by similarity desc
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [r[1] for r in results[:top_k]]
+        if 0 < top_k < count:
+            # Only the top_k need ordering: partition for the k-th best score, keep
+            # everything at or above it (ties included) and sort just those
+            kth = np.partition(similarities, count - top_k)[count - top_k]
+            candidates = np.flatnonzero(similarities >= kth)
+            order = candidates[np.argsort(-similarities[candidates], kind="stable")][:top_k]
+        else:
+            order = np.argsort(-similarities, kind="stable")[:top_k]
+        # Sorted by similarity desc; ties keep insertion order
+        return [self._matrix_nodes[i] for i in order]
 
     def ingest_entry(self, entry_text: str):
         """
@@ -81,17 +239,74 @@ class SpatialMemory:
         Also finds and links to similar existing nodes.
         """
         new_node = self.add_node(entry_text, "entry")
-        
-        # Auto-link to similar concepts
-        similar = self.find_similar(entry_text, top_k=2)
+        self._link_similar(new_node)
+        return new_node
+
+    def ingest_entries(self, entry_texts: List[str]) -> List[MemoryNode]:
+        """Batch form of ingest_entry: one encode call for all entries, then linking."""
+        new_nodes = []
+        for text, vector in zip(entry_texts, self._encode_many(entry_texts)):
+            # Insert and link one at a time, so each entry only sees the ones before it
+            node = self._insert(text, "entry", vector)
+            self._link_similar(node)
+            new_nodes.append(node)
+        return new_nodes
+
+    def _link_similar(self, new_node: MemoryNode):
+        # Auto-link to similar concepts; the node's own vector is the query, so the
+        # entry is not encoded a second time
+        similar = self._similar_to(new_node.vector, top_k=2)
         for node in similar:
             if node.id != new_node.id:
                 # Create an edge
                 self.add_edge(new_node, node, "semantically_related", weight=0.8)
                 print(f"  [Space] Linked '{new_node.content[:15]}...' to '{node.content[:15]}...'")
-        
-        return new_node
 
     def add_edge(self, source: MemoryNode, target: MemoryNode, relation: str, weight: float = 1.0):
-        edge = MemoryEdge(source.id, target.id, relation, weight)
-        self.edges.append(edge)
+        i = self._edge_count
+        if i == len(self._edge_src):
+            # Double on full to amortize reallocation
+            for name in ("_edge_src", "_edge_dst", "_edge_rel", "_edge_w"):
+                old = getattr(self, name)
+                grown = np.empty(2 * i, dtype=old.dtype)
+                grown[:i] = old
+                setattr(self, name, grown)
+        code = self._relation_codes.get(relation)
+        if code is None:
+            code = self._relation_codes[relation] = len(self._relations)
+            self._relations.append(relation)
+        self._edge_src[i] = self._index_of(source)
+        self._edge_dst[i] = self._index_of(target)
+        self._edge_rel[i] = code
+        self._edge_w[i] = weight
+        self._edge_count = i + 1
+
+    def _index_of(self, node: MemoryNode) -> int:
+        index = self.node_idx.get(node.id)
+        if index is None:
+            index = self.node_idx[node.id] = len(self._indexed_nodes)
+            self._indexed_nodes.append(node)
+        return index
+
+    @property
+    def edges(self) -> List[MemoryEdge]:
+        """Edges as MemoryEdge objects, built on demand from the edge arrays."""
+        nodes, relations = self._indexed_nodes, self._relations
+        n = self._edge_count
+        return [
+            MemoryEdge(nodes[src].id, nodes[dst].id, relations[rel], float(w))
+            for src, dst, rel, w in zip(self._edge_src[:n].tolist(), self._edge_dst[:n].tolist(),
+                                        self._edge_rel[:n].tolist(), self._edge_w[:n].tolist())
+        ]
+
+    def adjacency(self):
+        """Returns the graph in CSR form: (indptr, indices, weights) over node_idx indices.
+
+        Row i lists the targets of edges leaving the node with index i.
+        """
+        n = self._edge_count
+        src = self._edge_src[:n]
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(len(self._indexed_nodes) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=len(self._indexed_nodes)), out=indptr[1:])
+        return indptr, self._edge_dst[:n][order], self._edge_w[:n][order]
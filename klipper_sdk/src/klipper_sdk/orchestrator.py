@@ -1,10 +1,28 @@
 import yaml
 import time
-from typing import Dict, Any, List
+try:
+    # libyaml-backed parser; same results as SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+from typing import Dict, Any, List, Optional, Tuple
 from .agents import Agent, AgentRegistry
-from .tools import ToolRegistry
+from .tools import Tool, ToolRegistry
 from .learning_tools import ContentAnalysisTool, WorkflowPredictionTool
 
+def _load_data(content: str) -> Any:
+    """Parses blueprint content, trying the much faster JSON parser first when it looks like JSON."""
+    if content.lstrip()[:1] in ("{", "["):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            pass  # YAML flow style or other non-JSON; YAML accepts both
+    return yaml.load(content, Loader=_YamlLoader)
+
 class Orchestrator:
     """
     Gen 5 Orchestrator: capable of interpreting KickLang (.kl) blueprints
@@ -20,26 +38,39 @@ class Orchestrator:
         self.tool_registry.register(WorkflowPredictionTool())
         
         self.execution_log: List[Dict[str, Any]] = []
+        # Structural plane resolved to plain tuples on first execute
+        self._compiled_phases = None
 
     def load_blueprint(self, path: str):
         """Loads and parses a .kl file."""
         print(f"[Orchestrator] Loading blueprint from {path}...")
-        with open(path, 'r') as f:
-            content = f.read()
-            self.parse_blueprint(content)
+        with open(path, 'r', encoding='utf-8') as f:
+            # Skip the ⫻ header line, then let YAML read straight from the file
+            line = f.readline()
+            while line and not line.strip():
+                line = f.readline()
+            if not line.lstrip().startswith("⫻"):
+                f.seek(0)
+            # Peek at the body: JSON-shaped blueprints skip the YAML parser
+            start = f.tell()
+            head = f.read(64).lstrip()
+            f.seek(start)
+            if head[:1] in ("{", "["):
+                self._set_blueprint(_load_data(f.read()))
+            else:
+                self._set_blueprint(yaml.load(f, Loader=_YamlLoader))
 
     def parse_blueprint(self, content: str):
         """Parses a KickLang blueprint string."""
         # Skip the first line if it interacts poorly with yaml (e.g., ⫻kicklang:orchestration)
         if content.strip().startswith("⫻"):
-            # Find the first newline
-            parts = content.split("\n", 1)
-            if len(parts) > 1:
-                content = parts[1]
-            else:
-                content = "" # Empty if only header
+            # Everything after the first newline; empty if only header
+            newline = content.find("\n")
+            content = content[newline + 1:] if newline != -1 else ""
         
-        data = yaml.safe_load(content)
+        self._set_blueprint(_load_data(content))
+
+    def _set_blueprint(self, data: Any):
         if isinstance(data, list) and data:
             self.blueprint = data[0]
         elif isinstance(data, dict):
@@ -49,6 +80,7 @@ class Orchestrator:
         
         # Parse Planes
         self._setup_agents(self.blueprint.get('planes', {}).get('agentic', []))
+        self._compiled_phases = None
         
     def _setup_agents(self, agent_configs: List[Dict[str, Any]]):
         """Initializes agents from the blueprint."""
@@ -82,53 +114,58 @@ class Orchestrator:
         print("[Orchestrator] Starting execution...")
         dynamic_context = dynamic_context or {}
         
-        structural_plane = self.blueprint.get('planes', {}).get('structural', [])
+        if self._compiled_phases is None:
+            structural_plane = self.blueprint.get('planes', {}).get('structural', [])
+            self._compiled_phases = [self._compile_phase(phase) for phase in structural_plane]
         
         # Shared state across phases
         self.workflow_state = dynamic_context.copy()
         
-        for phase in structural_plane:
-            # print(f"\n>> Phase: {phase['name']} - {phase['description']}")
-            self._execute_phase(phase)
+        for steps in self._compiled_phases:
+            self._execute_phase(steps)
             
         return self.workflow_state
 
-    def _execute_phase(self, phase: Dict[str, Any]):
-        steps = phase.get('steps', [])
-        for step in steps:
-            print(f"  > Step: {step['name']}")
+    def _compile_phase(self, phase: Dict[str, Any]) -> List[Tuple[str, Agent, Optional[Tool], Tuple[Tuple[str, str], ...], Optional[str]]]:
+        """Resolves a phase's steps once: agent and tool objects, input mapping, output key."""
+        compiled = []
+        for step in phase.get('steps', []):
             agent_name = step.get('agent')
             tool_name = step.get('tool')
             
-            if not agent_name:
-                continue
-                
-            agent = self.agent_registry.get_agent(agent_name)
+            agent = self.agent_registry.get_agent(agent_name) if agent_name else None
+            if agent_name and agent is None:
+                raise ValueError(f"Step '{step['name']}' uses unknown agent '{agent_name}'")
             tool = self.tool_registry.get_tool(tool_name) if tool_name else None
             
-            # Resolve Inputs
+            # Resolve Inputs as (arg name, state key) pairs
             inputs_config = step.get('inputs', [])
-            context = {}
-            
             if isinstance(inputs_config, list):
                 # Direct mapping: arg name = state key
-                for key in inputs_config:
-                    context[key] = self.workflow_state.get(key)
+                inputs = tuple((key, key) for key in inputs_config)
             elif isinstance(inputs_config, dict):
                 # Remapping: arg name = inputs_config[arg name] -> value from state
-                for arg_name, state_key in inputs_config.items():
-                    context[arg_name] = self.workflow_state.get(state_key)
+                inputs = tuple(inputs_config.items())
+            else:
+                inputs = ()
+            
+            compiled.append((step['name'], agent, tool, inputs, step.get('outputs')))
+        return compiled
+
+    def _execute_phase(self, steps: List[Tuple[str, Agent, Optional[Tool], Tuple[Tuple[str, str], ...], Optional[str]]]):
+        state = self.workflow_state
+        for name, agent, tool, inputs, output_key in steps:
+            print(f"  > Step: {name}")
+            if agent is None:
+                # Steps without an agent are skipped
+                continue
+            
+            context = {arg_name: state.get(state_key) for arg_name, state_key in inputs}
             
             # Execute Agent
             # The Agent will use the tool if provided, passing 'context' as args.
             result = agent.execute(context, tools=[tool] if tool else None)
             
             # Store Outputs
-            output_key = step.get('outputs')
             if output_key:
-                self.workflow_state[output_key] = result
-                # Optional: specific logging
-                # if isinstance(result, list):
-                #     print(f"    [{agent.role}] Produced {len(result)} items for '{output_key}'.")
-                # else:
-                #     print(f"    [{agent.role}] Produced result for '{output_key}'.")
+                state[output_key] = result
@@ -1,5 +1,7 @@
+import itertools
 import pytest
 from unittest.mock import MagicMock, patch
+from jeepney import HeaderFields, MessageType
 from klipper_sdk import KlipperClient, ClipboardItem
 
 @pytest.fixture
@@ -16,23 +18,154 @@ def test_set_clipboard(mock_dbus):
     # Check if send_and_get_reply was called (jeepney sends one msg)
     assert mock_dbus.send_and_get_reply.called
 
+def fake_replies(conn, bodies):
+    """Answers pipelined calls in order, one reply per sent serial."""
+    conn.outgoing_serial = itertools.count(1)
+    sent = []
+    conn.send.side_effect = lambda msg, serial: sent.append(serial)
+
+    def receive():
+        serial = sent.pop(0)
+        body = bodies[serial - 1]
+        reply = MagicMock(body=body)
+        reply.header.fields = {HeaderFields.reply_serial: serial}
+        reply.header.message_type = MessageType.method_return
+        return reply
+    conn.receive.side_effect = receive
+
 def test_get_history(mock_dbus):
+    mock_dbus.send_and_get_reply.return_value = reply_with(["item 1", "", "item 3"])
+    
+    history = KlipperClient().get_history()
+    assert [item.content for item in history] == ["item 1", "item 3"]
+    assert history[1].id.startswith("2_")
+    # The whole history arrives in a single call
+    assert mock_dbus.send_and_get_reply.call_count == 1
+    assert not mock_dbus.send.called
+
+def test_get_history_falls_back_to_indexed_calls(mock_dbus):
     client = KlipperClient()
+    mock_dbus.send_and_get_reply.return_value = reply_with("Unknown method", message_type=MessageType.error)
     
     # Mock return values for getClipboardHistoryItem
     # Let's say it returns "item 1", "item 2", then ""
-    mock_dbus.send_and_get_reply.side_effect = [
-        ("item 1",),
-        ("item 2",),
-        ("",)
-    ]
+    fake_replies(mock_dbus, [("item 1",), ("item 2",)] + [("",)] * 18)
     
     history = client.get_history()
     assert len(history) == 2
     assert history[0].content == "item 1"
     assert history[1].content == "item 2"
+    # All index requests go out before the first reply is read
+    assert mock_dbus.send.call_count == KlipperClient.HISTORY_LIMIT
+
+def reply_with(*body, message_type=MessageType.method_return):
+    reply = MagicMock(body=body)
+    reply.header.message_type = message_type
+    return reply
+
+def test_get_current_content(mock_dbus):
+    mock_dbus.send_and_get_reply.return_value = reply_with("copied text")
+    assert KlipperClient().get_current_content() == "copied text"
+
+def test_get_current_content_error_reply(mock_dbus):
+    mock_dbus.send_and_get_reply.return_value = reply_with("No such service", message_type=MessageType.error)
+    assert KlipperClient().get_current_content() is None
+
+def test_get_current_content_reconnects_once():
+    with patch('klipper_sdk.client.open_dbus_connection') as mock_connect:
+        dropped, fresh = MagicMock(), MagicMock()
+        dropped.send_and_get_reply.side_effect = ConnectionResetError()
+        fresh.send_and_get_reply.return_value = reply_with("after reconnect")
+        mock_connect.side_effect = [dropped, fresh]
+
+        assert KlipperClient().get_current_content() == "after reconnect"
+        assert mock_connect.call_count == 2
 
 def test_clear_history(mock_dbus):
     client = KlipperClient()
     client.clear_history()
     assert mock_dbus.send_and_get_reply.called
+
+def test_watch_yields_content_per_signal():
+    import asyncio
+    from contextlib import asynccontextmanager, contextmanager
+    from unittest.mock import AsyncMock
+
+    signals = asyncio.Queue()
+    router = MagicMock()
+    router.send_and_get_reply = AsyncMock(side_effect=[
+        MagicMock(body=("first",)),
+        MagicMock(body=("second",)),
+    ])
+
+    @contextmanager
+    def fake_filter(rule, bufsize=1):
+        yield signals
+    router.filter = fake_filter
+
+    @asynccontextmanager
+    async def fake_router(bus):
+        yield router
+
+    async def collect():
+        signals.put_nowait("signal 1")
+        signals.put_nowait("signal 2")
+        received = []
+        async for content in KlipperClient().watch():
+            received.append(content)
+            if len(received) == 2:
+                break
+        return received
+
+    with patch('klipper_sdk.client.open_dbus_router', fake_router), \
+         patch('klipper_sdk.client.Proxy') as mock_proxy:
+        mock_proxy.return_value.AddMatch = AsyncMock()
+        assert asyncio.run(collect()) == ["first", "second"]
+        mock_proxy.return_value.AddMatch.assert_awaited_once()
+
+def test_watch_filter_matches_signal_from_unique_name():
+    import asyncio
+    from contextlib import asynccontextmanager, contextmanager
+    from unittest.mock import AsyncMock
+    from jeepney import DBusAddress, new_signal
+
+    # Signals on the bus carry the sender's unique name, never the well-known one
+    signal = new_signal(
+        DBusAddress(KlipperClient.OBJECT_PATH, interface=KlipperClient.INTERFACE),
+        "clipboardHistoryUpdated",
+    )
+    signal.header.fields[HeaderFields.sender] = ":1.42"
+
+    signals = asyncio.Queue()
+    router = MagicMock()
+    error_reply = MagicMock(body=("org.freedesktop.DBus.Error.Failed",))
+    error_reply.header.message_type = MessageType.error
+    router.send_and_get_reply = AsyncMock(side_effect=[
+        error_reply,
+        MagicMock(body=("content",)),
+    ])
+
+    @contextmanager
+    def matching_filter(rule, bufsize=1):
+        # Route only what the real MatchRule accepts, as jeepney's router does
+        if rule.matches(signal):
+            signals.put_nowait(signal)
+            signals.put_nowait(signal)
+        yield signals
+    router.filter = matching_filter
+
+    @asynccontextmanager
+    async def fake_router(bus):
+        yield router
+
+    async def first_content():
+        async for content in KlipperClient().watch():
+            return content
+
+    with patch('klipper_sdk.client.open_dbus_router', fake_router), \
+         patch('klipper_sdk.client.Proxy') as mock_proxy:
+        mock_proxy.return_value.AddMatch = AsyncMock()
+        # The error reply is skipped rather than yielded as clipboard content
+        assert asyncio.run(asyncio.wait_for(first_content(), 1)) == "content"
+        bus_rule = mock_proxy.return_value.AddMatch.await_args[0][0]
+        assert bus_rule.header_fields["sender"] == KlipperClient.BUS_NAME
@@ -0,0 +1,68 @@
+import pytest
+from klipper_sdk.clipboard_analyzer import ClipboardAnalyzer, ClipboardItem
+
+def make_item(text, uuid="1", added_time=1000.0):
+    return ClipboardItem(uuid=uuid, added_time=added_time, mimetypes="text/plain", text=text)
+
+@pytest.mark.parametrize("text,expected", [
+    ("https://example.com", "url"),
+    ("def foo():\n    return 1", "code_snippet"),
+    ("select id from users", "sql_query"),
+    ("SELECT *\nFROM users", "code_snippet"),
+    # Whole words only, SELECT before FROM
+    ("selected from the list", "text"),
+    ("from the menu, select one", "text"),
+    ("mail me at someone@example.com", "email"),
+    ("", "binary"),
+    ("Just some prose", "text"),
+])
+def test_analyze_content_type(text, expected):
+    analyzer = ClipboardAnalyzer()
+    assert analyzer.analyze_content_type(make_item(text)) == expected
+
+def test_sql_check_is_linear_on_many_selects():
+    import time
+    # e.g. HTML with many <select> elements; the old 'SELECT.*FROM' regex took ~22 s here
+    item = make_item("<select> " * 20_000)
+    start = time.perf_counter()
+    assert ClipboardAnalyzer().analyze_content_type(item) == "text"
+    assert time.perf_counter() - start < 0.5
+
+def test_predict_workflow_research():
+    analyzer = ClipboardAnalyzer()
+    analyzer.ingest_items([
+        make_item("https://example.com", uuid="1", added_time=3.0),
+        make_item("https://example.org", uuid="2", added_time=2.0),
+        make_item("notes", uuid="3", added_time=1.0),
+    ])
+    prediction = analyzer.predict_workflow()
+    assert prediction.name == "Research"
+    assert "2 of 3" in prediction.reasoning
+
+def test_ingest_items_keeps_newest_first_across_batches():
+    analyzer = ClipboardAnalyzer()
+    analyzer.ingest_items([make_item("a", uuid="a", added_time=5.0), make_item("b", uuid="b", added_time=1.0)])
+    analyzer.ingest_items([make_item("c", uuid="c", added_time=3.0), make_item("d", uuid="d", added_time=9.0),
+                           make_item("e", uuid="e", added_time=5.0)])
+    assert [item.uuid for item in analyzer.items] == ["d", "a", "e", "c", "b"]
+
+def test_analyze_content_type_cache_is_bounded_and_keyed_by_text():
+    from klipper_sdk.clipboard_analyzer import _classify
+    _classify.cache_clear()
+    analyzer = ClipboardAnalyzer()
+    for uuid in ("1", "2", "3"):
+        assert analyzer.analyze_content_type(make_item("https://example.com", uuid=uuid)) == "url"
+    assert _classify.cache_info().hits == 2
+    assert analyzer.analyze_content_type(make_item("x" * 10_000)) == "text"
+    assert _classify.cache_info().currsize == 1
+    assert _classify.cache_info().maxsize is not None
+
+def test_cluster_by_time_splits_on_gaps():
+    analyzer = ClipboardAnalyzer()
+    analyzer.ingest_items([make_item(str(t), uuid=str(t), added_time=t) for t in (0.0, 10.0, 100.0, 110.0, 115.0, 500.0)])
+    clusters = analyzer.cluster_by_time(threshold_seconds=20)
+    assert clusters == [(0, 1), (1, 4), (4, 6)]
+    assert [[item.uuid for item in analyzer.items[start:end]] for start, end in clusters] == [
+        ["500.0"], ["115.0", "110.0", "100.0"], ["10.0", "0.0"],
+    ]
+    assert ClipboardAnalyzer().cluster_by_time() == []
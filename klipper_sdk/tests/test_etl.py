@@ -0,0 +1,40 @@
+from klipper_sdk.etl import ETLPipeline
+
+def make_pipeline(rows):
+    pipeline = ETLPipeline()
+    pipeline.conn.execute(
+        "CREATE TABLE main (uuid TEXT PRIMARY KEY, added_time REAL, last_used_time REAL, "
+        "mimetypes TEXT, text TEXT, starred INTEGER)"
+    )
+    pipeline.conn.executemany("INSERT INTO main VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return pipeline
+
+def test_ingest_main_sanitizes_rows():
+    pipeline = make_pipeline([
+        ("a", 100.0, 150.0, '["text/plain", "text/html"]', "hello", 1),
+        ("b", -5.0, None, "image/png", None, 0),
+        ("c", 200.0, -1.0, "", "world", None),
+    ])
+    rows = {row.uuid: row for row in pipeline.ingest_main()}
+
+    assert rows["a"].added_time == 100.0
+    assert rows["a"].last_used_time == 150.0
+    assert rows["a"].mimetypes == ["text/plain", "text/html"]
+    assert rows["a"].starred is True
+
+    assert rows["b"].added_time == 0.1
+    assert rows["b"].last_used_time is None
+    assert rows["b"].mimetypes == ["image/png"]
+    assert rows["b"].text is None
+    assert rows["b"].starred is False
+
+    assert rows["c"].last_used_time is None
+    assert rows["c"].mimetypes == []
+    assert rows["c"].starred is False
+
+def test_ingest_main_empty_table():
+    assert make_pipeline([]).ingest_main() == []
+
+def test_ingest_main_rows_are_lightweight():
+    row = make_pipeline([("a", 1.0, None, "text/plain", "hi", 0)]).ingest_main()[0]
+    assert not hasattr(row, "__dict__")
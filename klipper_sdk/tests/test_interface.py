@@ -0,0 +1,20 @@
+import pytest
+from klipper_sdk.interface import SpaceInterface
+
+@pytest.mark.parametrize("text,expected", [
+    ("⫻content/meta-summary:cell/0\nline 1\nline 2",
+     {"name": "content", "type": "meta-summary", "place": "cell", "index": "0", "content": "line 1\nline 2"}),
+    ("⫻event:input", {"name": "event", "type": None, "place": "input", "index": None, "content": ""}),
+    ("⫻a/b/c\n", {"name": "a", "type": "b", "place": None, "index": "c", "content": ""}),
+])
+def test_parse_section(text, expected):
+    assert SpaceInterface().parse_section(text) == expected
+
+@pytest.mark.parametrize("text", ["no header\n⫻content/x", "⫻Upper", "⫻name/type trailing"])
+def test_parse_section_rejects_invalid_header(text):
+    assert SpaceInterface().parse_section(text) == {"error": "Invalid Space Header"}
+
+def test_generate_section_round_trips():
+    si = SpaceInterface()
+    block = si.generate_section("response", "body", "output", "display")
+    assert si.parse_section(block)["content"] == "body"
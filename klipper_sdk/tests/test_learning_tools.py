@@ -0,0 +1,36 @@
+import pytest
+from klipper_sdk.learning_tools import ContentAnalysisTool, WorkflowPredictionTool
+from klipper_sdk.models import ClipboardItem
+
+@pytest.mark.parametrize("text,expected", [
+    ("", "binary"),
+    ("https://example.com/page", "url"),
+    ("select id from users where x = 1", "sql_query"),
+    ("import os\nx = os.getcwd()", "python_code"),
+    ("import React from 'react'", "frontend_code"),
+    (".box { margin: 0; padding: 4px; }", "css_style"),
+    ("#!/bin/sh\necho hi", "shell_command"),
+    ("git status", "shell_command"),
+    ('{"key": "value"}', "json_data"),
+    ("x <- c(1, 2)\ny <- f(x)[1]\n{z}", "code_snippet"),
+    ("Just a note to self", "text"),
+])
+def test_analyze_content_type(text, expected):
+    assert ContentAnalysisTool().run(text) == expected
+
+def test_analyze_batch_of_items():
+    items = [{"text": "https://a.example"}, ClipboardItem.from_raw(0, "plain words"), None]
+    assert ContentAnalysisTool().run(items) == ["url", "text", "text"]
+
+def test_predict_workflow_score():
+    result = WorkflowPredictionTool().run(["shell_command", "shell_command"], ["docker compose up"])
+    assert result["name"] == "DevOps/SRE"
+    assert WorkflowPredictionTool().run(["url"])["name"] == "General"
+
+def test_repeated_texts_hit_the_cache():
+    from klipper_sdk.learning_tools import _classify
+    _classify.cache_clear()
+    ContentAnalysisTool().run(["git pull", "git pull", "git pull"])
+    assert _classify.cache_info().hits == 2
+    ContentAnalysisTool().run("x" * 10_000)
+    assert _classify.cache_info().currsize == 1
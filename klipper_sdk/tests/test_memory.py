@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+from klipper_sdk import memory
+
+class FakeEncoder:
+    """Deterministic stand-in for SentenceTransformer: bag of characters."""
+    loads = 0
+
+    def __init__(self, name):
+        FakeEncoder.loads += 1
+        self.calls = 0
+
+    def encode(self, text, **kwargs):
+        self.calls += 1
+        if isinstance(text, list):
+            return np.stack([self._embed(t) for t in text])
+        return self._embed(text)
+
+    @staticmethod
+    def _embed(text):
+        vector = np.zeros(64, dtype=np.float32)
+        for ch in text:
+            vector[ord(ch) % 64] += 1.0
+        return vector
+
+@pytest.fixture
+def fake_encoder(monkeypatch):
+    FakeEncoder.loads = 0
+    monkeypatch.setattr(memory, "HAS_EMBEDDINGS", True)
+    monkeypatch.setattr(memory, "SentenceTransformer", FakeEncoder, raising=False)
+    monkeypatch.setattr(memory, "_encoder", None)
+    monkeypatch.setattr(memory, "_encoder_loaded", False)
+    return FakeEncoder
+
+def test_encoder_is_loaded_once(fake_encoder):
+    first, second = memory.SpatialMemory(), memory.SpatialMemory()
+    assert first.model is second.model
+    assert fake_encoder.loads == 1
+
+def test_find_similar_ranks_by_cosine(fake_encoder):
+    space = memory.SpatialMemory()
+    for text in ("aaaa", "aaab", "zzzz"):
+        space.add_node(text)
+    assert [node.content for node in space.find_similar("aaaa", top_k=2)] == ["aaaa", "aaab"]
+
+def test_ingest_entries_matches_sequential_ingest(fake_encoder):
+    texts = ["aaaa", "zzzz", "aaab", "zzzy"]
+    one_by_one, batched = memory.SpatialMemory(), memory.SpatialMemory()
+    for text in texts:
+        one_by_one.ingest_entry(text)
+    batched.model.calls = 0
+    batched.ingest_entries(texts)
+
+    def links(space):
+        return sorted((space.nodes[e.source_id].content, space.nodes[e.target_id].content) for e in space.edges)
+    assert links(batched) == links(one_by_one)
+    assert batched.model.calls == 1
+
+def test_similarity_matrix_grows_with_nodes(fake_encoder):
+    space = memory.SpatialMemory()
+    space.add_nodes([chr(ord("a") + i % 26) * (i + 1) for i in range(40)])
+    space.add_node("q")
+    assert space.find_similar("qqq", top_k=1)[0].content.startswith("q")
+    assert len(space.find_similar("abc", top_k=50)) == 41
+
+def test_repeated_content_is_encoded_once(fake_encoder):
+    space = memory.SpatialMemory()
+    space.model.calls = 0
+    space.ingest_entry("copied twice")
+    space.ingest_entry("copied twice")
+    space.ingest_entries(["copied twice", "new", "new"])
+    assert space.model.calls == 2
+    assert len(space.nodes) == 5
+
+def test_encoder_prefers_quantized_onnx_backend(fake_encoder, monkeypatch):
+    loaded = []
+
+    class OnnxAwareEncoder(FakeEncoder):
+        def __init__(self, name, **kwargs):
+            super().__init__(name)
+            loaded.append(kwargs)
+
+    monkeypatch.setattr(memory, "SentenceTransformer", OnnxAwareEncoder)
+    memory.SpatialMemory()
+    assert loaded == [{"backend": "onnx", "model_kwargs": {"file_name": memory.EMBEDDING_ONNX_FILE}}]
+
+def test_edges_round_trip_through_arrays(fake_encoder):
+    space = memory.SpatialMemory()
+    a, b, c = space.add_nodes(["a", "b", "c"])
+    for i in range(100):
+        space.add_edge(a if i % 2 else c, b, "near" if i % 3 else "far", weight=0.5)
+
+    edges = space.edges
+    assert len(edges) == 100
+    assert (edges[0].source_id, edges[0].target_id, edges[0].relation, edges[0].weight) == (c.id, b.id, "far", 0.5)
+
+    indptr, indices, weights = space.adjacency()
+    rows = {node.content: indices[indptr[i]:indptr[i + 1]] for node, i in
+            ((n, space.node_idx[n.id]) for n in (a, b, c))}
+    assert len(rows["a"]) == len(rows["c"]) == 50
+    assert len(rows["b"]) == 0
+    assert set(rows["a"].tolist()) == {space.node_idx[b.id]}
+    assert weights.sum() == 50.0
+
+def test_persisted_memory_reloads_without_encoding(fake_encoder, tmp_path):
+    space = memory.SpatialMemory(persist_dir=str(tmp_path))
+    texts = [f"entry {i} " + "x" * i for i in range(20)]
+    space.ingest_entries(texts)
+    expected = [node.content for node in space.find_similar("entry 7 xxxxxxx", top_k=3)]
+    space.close()
+
+    reloaded = memory.SpatialMemory(persist_dir=str(tmp_path))
+    reloaded.model.calls = 0
+    assert sorted(node.content for node in reloaded.nodes.values()) == sorted(texts)
+    reloaded.add_node("entry 3 xxx")
+    assert reloaded.model.calls == 0
+    assert [node.content for node in reloaded.find_similar("entry 7 xxxxxxx", top_k=3)] == expected
+    reloaded.close()
+
+def test_top_k_matches_full_sort_including_ties(fake_encoder):
+    space = memory.SpatialMemory()
+    texts = ["ab", "ba", "abc", "ab", "zz", "ab ", "cab", "ba"]
+    space.add_nodes(texts)
+    full = space.find_similar("ab", top_k=len(texts))
+    for k in range(1, len(texts)):
+        assert space.find_similar("ab", top_k=k) == full[:k]
+    assert [node.content for node in full[:3]] == ["ab", "ba", "ab"]
@@ -0,0 +1,71 @@
+import pytest
+from klipper_sdk.orchestrator import Orchestrator
+
+BLUEPRINT = """⫻kicklang:orchestration
+planes:
+  agentic:
+    - name: "Worker"
+      role: "Processor"
+  structural:
+    - name: "Phase"
+      steps:
+        - name: "Analyze"
+          agent: "Worker"
+          tool: "analyze_content_type"
+          inputs: { "data": "entries" }
+          outputs: "types"
+"""
+
+def test_load_blueprint_matches_parse_blueprint(tmp_path):
+    path = tmp_path / "flow.kl"
+    path.write_text("\n" + BLUEPRINT, encoding="utf-8")
+    from_file, from_text = Orchestrator(), Orchestrator()
+    from_file.load_blueprint(str(path))
+    from_text.parse_blueprint(BLUEPRINT)
+    assert from_file.blueprint == from_text.blueprint
+    assert from_file.agent_registry.get_agent("Worker").role == "Processor"
+
+def test_execute_runs_tool_steps():
+    orchestrator = Orchestrator()
+    orchestrator.parse_blueprint(BLUEPRINT)
+    state = orchestrator.execute({"entries": ["https://example.com", "plain"]})
+    assert state["types"] == ["url", "text"]
+
+def test_header_only_blueprint_is_rejected():
+    with pytest.raises(ValueError):
+        Orchestrator().parse_blueprint("⫻kicklang:orchestration")
+
+def test_steps_resolve_once_per_blueprint():
+    orchestrator = Orchestrator()
+    orchestrator.parse_blueprint(BLUEPRINT)
+    orchestrator.execute({"entries": []})
+    compiled = orchestrator._compiled_phases
+    orchestrator.execute({"entries": ["x"]})
+    assert orchestrator._compiled_phases is compiled
+
+    orchestrator.parse_blueprint(BLUEPRINT.replace('"types"', '"kinds"'))
+    assert orchestrator.execute({"entries": ["x"]})["kinds"] == ["text"]
+
+def test_unknown_agent_is_reported():
+    orchestrator = Orchestrator()
+    orchestrator.parse_blueprint(BLUEPRINT.replace('agent: "Worker"', 'agent: "Nobody"'))
+    with pytest.raises(ValueError, match="Nobody"):
+        orchestrator.execute({})
+
+def test_json_blueprints_match_yaml(tmp_path):
+    import json, yaml
+    body = yaml.safe_load(BLUEPRINT.split("\n", 1)[1])
+    as_json = "⫻kicklang:orchestration\n" + json.dumps(body)
+    path = tmp_path / "flow.kl"
+    path.write_text(as_json, encoding="utf-8")
+
+    from_yaml, from_json, from_file = Orchestrator(), Orchestrator(), Orchestrator()
+    from_yaml.parse_blueprint(BLUEPRINT)
+    from_json.parse_blueprint(as_json)
+    from_file.load_blueprint(str(path))
+    assert from_yaml.blueprint == from_json.blueprint == from_file.blueprint
+
+def test_yaml_flow_mapping_still_parses():
+    orchestrator = Orchestrator()
+    orchestrator.parse_blueprint("{planes: {agentic: [{name: Worker}]}}")
+    assert orchestrator.agent_registry.get_agent("Worker") is not None
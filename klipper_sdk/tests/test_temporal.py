@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime
+from klipper_sdk.etl import RowMainRaw
 from klipper_sdk.learning import LearningManager, TemporalPredictor
 
 class TestTemporalLayer(unittest.TestCase):
@@ -22,6 +23,37 @@ class TestTemporalLayer(unittest.TestCase):
         avg = sum(intervals) / len(intervals)
         self.assertAlmostEqual(avg, 3600.0)
 
+    def test_out_of_order_events_stay_sorted(self):
+        pred = TemporalPredictor()
+        for t in (3.0, 1.0, 4.0, 2.0):
+            pred.add_event(t)
+        self.assertEqual(pred.history, [1.0, 2.0, 3.0, 4.0])
+
+    def test_prediction_projects_past_rhythm_forward(self):
+        pred = TemporalPredictor()
+        now = datetime.now().timestamp()
+        for i in range(3):
+            pred.add_event(now - 10000 + i * 600)
+
+        predicted = pred.predict_next()
+        self.assertGreaterEqual(predicted, now)
+        self.assertLess(predicted - now, 600 + 5.0)
+        # Still on the original 600s grid
+        self.assertAlmostEqual((predicted - pred.history[-1]) % 600, 0.0, places=3)
+
+    def test_prediction_is_reused_until_next_event(self):
+        pred = TemporalPredictor()
+        now = datetime.now().timestamp()
+        pred.add_event(now)
+        pred.add_event(now + 600)
+
+        first = pred.predict_next()
+        self.assertAlmostEqual(first, now + 1200)
+        self.assertEqual(pred.predict_next(), first)
+
+        pred.add_event(now + 1200)
+        self.assertAlmostEqual(pred.predict_next(), now + 1800)
+
     def test_learning_manager_integration(self):
         lm = LearningManager()
         now = datetime.now().timestamp()
@@ -34,5 +66,28 @@ class TestTemporalLayer(unittest.TestCase):
         # Allow small delta
         self.assertTrue(abs(predicted - expected) < 5.0)
 
+    def test_engineer_features(self):
+        rows = [
+            RowMainRaw("a", 100.0, 86500.0, ["text/plain"], "hi", True),
+            RowMainRaw("b", 86500.0, None, ["text/plain"], "there", False),
+        ]
+        df = LearningManager().engineer_features(rows)
+
+        self.assertEqual(list(df["uuid"]), ["a", "b"])
+        self.assertAlmostEqual(df["age_in_days"].iloc[0] - df["age_in_days"].iloc[1], 1.0)
+        self.assertAlmostEqual(df["recency_score"].iloc[0], df["age_in_days"].iloc[1])
+        # Never-used rows get the 999.0 sentinel
+        self.assertEqual(df["recency_score"].iloc[1], 999.0)
+        self.assertEqual(list(df["starred"]), [1, 0])
+        self.assertEqual(list(df["last_used_time"]), [86500.0, 0.0])
+
+    def test_engineer_features_empty(self):
+        df = LearningManager().engineer_features([])
+        self.assertEqual(len(df), 0)
+        self.assertEqual(
+            list(df.columns),
+            ["uuid", "age_in_days", "recency_score", "mimetypes", "starred", "last_used_time"],
+        )
+
 if __name__ == '__main__':
     unittest.main()